@@ -28,6 +28,7 @@ class DihedralElement:
     twin must be set and managed by the inherited class (see :func: DihedralElement.twin()).
     Acts as a circular, doubly linked list where each element links to another such list.
     """
+    __slots__ = ('id', '_twin', '_cw_next', '_ccw_next')
 
     def __init__(self, id):
         r"""
@@ -259,14 +260,23 @@ class DihedralElement:
             sage: d1.get_cw_ith_element(-5) == d1
             True
 
+        Full loops around the list are skipped once its length is known.
+
+            sage: d1.get_cw_ith_element(2001) == d2
+            True
+
         .. NOTE::
 
-            Runtime: O(i)
+            Runtime: O(min(i, n)), where n is the number of elements in the list.
         """
         e = self
+        n = 0
         while i > 0:
-            e = e.cw_next()
+            e = e._cw_next
             i -= 1
+            n += 1
+            # after one full loop, the remaining steps only matter modulo n
+            if e is self: i %= n
         return e
 
     def get_ccw_ith_element(self, i):
@@ -297,14 +307,23 @@ class DihedralElement:
             sage: d1.get_ccw_ith_element(-5) == d1
             True
 
+        Full loops around the list are skipped once its length is known.
+
+            sage: d1.get_ccw_ith_element(2001) == d2
+            True
+
         .. NOTE::
 
-            Runtime: O(i)
+            Runtime: O(min(i, n)), where n is the number of elements in the list.
         """
         e = self
+        n = 0
         while i > 0:
-            e = e.ccw_next()
+            e = e._ccw_next
             i -= 1
+            n += 1
+            # after one full loop, the remaining steps only matter modulo n
+            if e is self: i %= n
         return e
 
     # Turn functions
@@ -508,9 +527,16 @@ class DihedralElement:
             sage: d1.insert_cw_next(d3)
             sage: d3.get_num_elements()
             3
+
+        .. NOTE::
+
+            Runtime: O(n). Walks the links directly rather than going through the iterator.
         """
-        count = 0
-        for element in self: count += 1
+        count = 1
+        e = self._cw_next
+        while e is not self:
+            e = e._cw_next
+            count += 1
         return count
 
     def get_elements_as_list(self, clockwise=True):
@@ -540,9 +566,17 @@ class DihedralElement:
             sage: d1.insert_cw_next(d3)
             sage: d2.get_elements_as_list(False) == [d2, d3, d1]
             True
+
+        .. NOTE::
+
+            Runtime: O(n). Walks the links directly rather than going through the iterator.
         """
-        if clockwise: return [element for element in self.iterate_clockwise()]
-        else: [element for element in self.iterate_counterclockwise()]
+        elements = [self]
+        e = self._cw_next if clockwise else self._ccw_next
+        while e is not self:
+            elements.append(e)
+            e = e._cw_next if clockwise else e._ccw_next
+        return elements
 
     def __iter__(self): # by default, iteration will go clockwise
         r"""
@@ -628,6 +662,6 @@ class _DihedralIterator:
             else: self.begin = True
 
         old = self.iter
-        self.iter = self.iter.cw_next() if self.clockwise else self.iter.ccw_next()
+        self.iter = old._cw_next if self.clockwise else old._ccw_next
         return old
 
@@ -30,6 +30,9 @@ class HalfHourglass(DihedralElement):
 
     A HalfHourglass is always assumed to be between two Vertices and be linked to adjacent HalfHourglasses for v_from.
     """
+    __slots__ = ('_v_from', '_v_to', '_multiplicity', 'label', '_half_strands_head', '_half_strands_tail',
+                 '_left_face', '_right_face', '_angle', '_angle_key')
+
     def __init__(self, id, v_from, v_to, multiplicity, twin=None):
         r"""
         Constructs a HalfHourglass with the given ID, between vertices v_from and v_to, and constructs `multiplicity` strands.
@@ -87,11 +90,12 @@ class HalfHourglass(DihedralElement):
                 self.twin()._half_strands_head = None
                 self.twin()._half_strands_tail = None
             else:
-                self._half_strands_head = HalfStrand(ID.get_new_id(f"{id}_s"), self)
+                strand_prefix = f"{id}_s"
+                self._half_strands_head = HalfStrand(ID.get_new_id(strand_prefix), self)
                 self.twin()._half_strands_head = self._half_strands_head.twin()
                 for i in range(1, multiplicity): # runs multiplicity-1 times as we have already created a head strand
                     # potentially use thicken() instead of doing this manually?
-                    strand = HalfStrand(ID.get_new_id(f"{id}_s"), self)
+                    strand = HalfStrand(ID.get_new_id(strand_prefix), self)
                     self._half_strands_head.append_cw(strand)
                     self.twin()._half_strands_head.append_cw(strand.twin())
                 self._half_strands_tail = self._half_strands_head.cw_last()
@@ -101,6 +105,10 @@ class HalfHourglass(DihedralElement):
         self._left_face = None
         self._right_face = None
 
+        # cached result of get_angle(), valid for the coordinates in _angle_key
+        self._angle = None
+        self._angle_key = None
+
     def __repr__(self):
         r"""
         Returns a String representation of this HalfHourglass, providing its ID, vertices, and multiplicity.
@@ -226,6 +234,56 @@ class HalfHourglass(DihedralElement):
     insert_cw_prev = insert_ccw_next # alias
     append_cw = insert_ccw_next # alias
 
+    def splice_in_order(self, elements):
+        r"""
+        Inserts elements into the list so that they follow this element clockwise in the given order,
+        including linking their HalfStrands. Equivalent to repeatedly calling insert_cw_next on the
+        previously inserted element, but the list and the strands are each relinked only once.
+
+        INPUT:
+
+        - `elements` -- list of HalfHourglass; the elements to insert, each of which should be its own list.
+
+        EXAMPLES:
+
+            sage: ID.reset_id()
+            sage: hh1 = HalfHourglass('hh1', None, None, 1)
+            sage: hh2 = HalfHourglass('hh2', None, None, 0)
+            sage: hh3 = HalfHourglass('hh3', None, None, 2)
+            sage: hh1.splice_in_order([hh2, hh3])
+            sage: hh1.get_elements_as_list() == [hh1, hh2, hh3]
+            True
+            sage: [s.id for s in hh1._half_strands_head]
+            ['hh1_s0', 'hh3_s1', 'hh3_s2']
+        """
+        if len(elements) == 0: return
+
+        # link the elements into a chain, then splice the chain in after self
+        for prev, element in zip(elements, elements[1:]):
+            prev._cw_next = element
+            element._ccw_next = prev
+        elements[-1]._cw_next = self._cw_next
+        self._cw_next._ccw_next = elements[-1]
+        self._cw_next = elements[0]
+        elements[0]._ccw_next = self
+
+        # link up strands of the new elements into a single closed chain
+        stranded = [element for element in elements if element._half_strands_head is not None]
+        if len(stranded) == 0: return
+        for prev, element in zip(stranded, stranded[1:]):
+            prev._half_strands_tail.link_cw_next(element._half_strands_head)
+        head = stranded[0]._half_strands_head
+        tail = stranded[-1]._half_strands_tail
+        tail.link_cw_next(head)
+
+        # splice the strand chain in front of the next existing strand, if there is one
+        next_strand = elements[-1].cw_next()._get_first_strand()
+        if next_strand.hourglass() in stranded: return
+
+        prev_strand = next_strand.cw_prev()
+        tail.link_cw_next(next_strand)
+        head.link_cw_prev(prev_strand)
+
     def remove(self):
         r"""
         Removes this HalfHourglass from its list, including unlinking its HalfStrands.
@@ -320,7 +378,7 @@ class HalfHourglass(DihedralElement):
         """
         if (self.is_phantom()): raise RuntimeError("Cannot add a strand to a phantom/boundary edge.")
 
-        new_strand = HalfStrand(ID.get_new_id(str(self.id) + "_"), self)
+        new_strand = HalfStrand(ID.get_new_id(f"{self.id}_"), self)
         self._half_strands_tail.insert_cw_next(new_strand)
         self._half_strands_tail.twin().insert_cw_next(new_strand.twin())
         self._half_strands_tail = new_strand
@@ -328,6 +386,8 @@ class HalfHourglass(DihedralElement):
 
         self._multiplicity += 1
         self.twin()._multiplicity += 1
+        self._v_from._total_degree += 1
+        self._v_to._total_degree += 1
     thicken = add_strand # alias
 
     def remove_strand(self):
@@ -369,6 +429,8 @@ class HalfHourglass(DihedralElement):
 
         self._multiplicity -= 1
         self.twin()._multiplicity -= 1
+        self._v_from._total_degree -= 1
+        self._v_to._total_degree -= 1
     thin = remove_strand # alias
 
     def _get_first_strand(self):
@@ -535,11 +597,20 @@ class HalfHourglass(DihedralElement):
             sage: hh = Vertex.create_hourglass_between(Vertex('v1', 0, 0, True), Vertex('v2', 1, -0.01, True), 1)
             sage: hh.get_angle()
             6.273185640492921
+
+        .. NOTE::
+
+            The angle is cached and only recomputed when the coordinates of v_from or v_to change.
         """
-        angle = math.atan2(self.v_to().y - self.v_from().y, self.v_to().x - self.v_from().x)
-        if angle < 0:
-            angle += 2 * math.pi
-        return angle
+        v_from, v_to = self._v_from, self._v_to
+        key = (v_from.x, v_from.y, v_to.x, v_to.y)
+        if key != self._angle_key:
+            angle = math.atan2(v_to.y - v_from.y, v_to.x - v_from.x)
+            if angle < 0:
+                angle += 2 * math.pi
+            self._angle = angle
+            self._angle_key = key
+        return self._angle
 
     def iterate_left_turns(self):
         r"""
@@ -29,6 +29,7 @@ class HalfStrand(DihedralElement):
     violating these assumptions may lead to crashes or infinite loops. HalfStrands should not
     typically be instantiated on their own, and are instead managed by higher level classes.
     """
+    __slots__ = ('_hourglass', 'label')
 
     def __init__(self, id, hourglass, twin=None, label=''):
         r"""
@@ -291,38 +292,62 @@ class HalfStrand(DihedralElement):
 
             Runtime: O(rn), where r is the valence of the graph.
         """
-        trip_value = (lambda strand : strand) if output == 'half_strands' else (lambda strand : strand.hourglass()) if output == 'half_hourglasses' else (lambda strand : strand.id)
-
-        visited = list()
-        # Keep track of visited strands to avoid isolated trips. This is only possible if not starting on the boundary, as trip traversal is invertible.
-        # An isolated trip occurs when a trip starting at an interior strand never reaches the boundary.
-        visited_set = set()
-        # Only check for membership in visited_set if we don't start on the boundary.
-        is_valid = (lambda strand : not strand.v_to().boundary) if self.v_from().boundary else (lambda strand : not strand.v_to().boundary and strand not in visited_set)
-        # Only add strand to visited_set if we don't start on the boundary. Note that the second lambda returns a tuple of (None, None) while still executing both functions.
-        add_data = (lambda strand : visited.append(trip_value(strand))) if self.v_from().boundary else (lambda strand: (visited.append(trip_value(strand)), visited_set.add(strand)))
-
+        strands = []
         strand = self
-        while is_valid(strand):
-            add_data(strand)
-            strand = strand.get_ith_trip_turn(i)
-        # Add the last strand leading to the boundary. Not necessary if we are in an isolated trip.
-        if strand not in visited_set:
-            add_data(strand)
-        # If we are in an isolated trip, no further work is necessary.
+        if self.v_from().boundary:
+            while not strand.v_to().boundary:
+                strands.append(strand)
+                strand = strand.get_ith_trip_turn(i)
+            # Add the last strand leading to the boundary.
+            strands.append(strand)
         else:
-            return visited
+            # Keep track of visited strands to detect isolated trips. This is only necessary if not starting on the boundary,
+            # as trip traversal is invertible. An isolated trip occurs when a trip starting at an interior strand never reaches the boundary.
+            visited_set = set()
+            while not strand.v_to().boundary and strand not in visited_set:
+                strands.append(strand)
+                visited_set.add(strand)
+                strand = strand.get_ith_trip_turn(i)
+            # If we are not in an isolated trip, add the last strand leading to the boundary and find the other direction of the trip.
+            if strand not in visited_set:
+                strands.append(strand)
+
+                strand = self.invert_ith_trip_turn(i)
+                prepend_strands = [strand]
+                while not strand.v_from().boundary:
+                    strand = strand.invert_ith_trip_turn(i)
+                    prepend_strands.append(strand)
+
+                prepend_strands.reverse()
+                strands = prepend_strands + strands
+
+        if output == 'half_strands':
+            return strands
+        if output == 'half_hourglasses':
+            return [strand.hourglass() for strand in strands]
+        return [strand.id for strand in strands]
+
+    def get_trip_end(self, i):
+        r"""
+        Follows trip i from this strand until the boundary is reached, and returns the last strand of the trip.
+        Unlike get_trip, no list of visited strands is built.
 
-        # We may need to find the other direction of the trip if we didn't start on the boundary.
-        if (not self.v_from().boundary):
+        INPUT:
+
+            - ``i`` -- positive integer; the trip number. Assumed to be an integer `\geq 1`.
 
-            strand = self.invert_ith_trip_turn(i)
-            prepend_visited = [trip_value(strand)]
+        OUTPUT: HalfStrand; the strand whose v_to() is the boundary vertex where the trip ends.
 
-            while not strand.v_from().boundary:
-                strand = strand.invert_ith_trip_turn(i)
-                prepend_visited.append(trip_value(strand))
+        .. WARNING::
 
-            prepend_visited.reverse()
-            visited = prepend_visited + visited
-        return visited
+            This strand should start from a boundary vertex; an isolated trip starting from an interior strand
+            never reaches the boundary, and this function would not terminate.
+
+        .. SEEALSO::
+
+            :func:`get_trip`
+        """
+        strand = self
+        while not strand.v_to().boundary:
+            strand = strand.get_ith_trip_turn(i)
+        return strand
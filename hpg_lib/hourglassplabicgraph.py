@@ -175,6 +175,9 @@ class HourglassPlabicGraph:
         half_hourglass_history = [hh]
         vertices_visited = []
         vertex_history = []
+        # Sets mirroring the visited lists for constant time membership tests
+        half_hourglasses_seen = {hh}
+        vertices_seen = set()
 
         # Perform breadth-first search to traverse the graph
         i = 0
@@ -183,15 +186,18 @@ class HourglassPlabicGraph:
             hh_twin = hh.twin()
             hh_next = hh.cw_next()
             v = hh.v_from()
-            if hh_twin not in half_hourglasses_visited:
+            if hh_twin not in half_hourglasses_seen:
+                half_hourglasses_seen.add(hh_twin)
                 half_hourglasses_visited.append(hh_twin)
             half_hourglass_history.append(hh_twin)
 
-            if hh_next not in half_hourglasses_visited:
+            if hh_next not in half_hourglasses_seen:
+                half_hourglasses_seen.add(hh_next)
                 half_hourglasses_visited.append(hh_next)
             half_hourglass_history.append(hh_next)
 
-            if v not in vertices_visited:
+            if v not in vertices_seen:
+                vertices_seen.add(v)
                 vertices_visited.append(v)
             vertex_history.append(v)
 
@@ -217,8 +223,10 @@ class HourglassPlabicGraph:
             True
         """
         hh_visited, hh_history, v_visited, v_history = self.traverse()
-        hh_hash = tuple((hh_visited.index(hh), hh.multiplicity()) for hh in hh_history)
-        v_hash = tuple((v_visited.index(v), v.filled) for v in v_history)
+        hh_index = {hh: i for i, hh in enumerate(hh_visited)}
+        v_index = {v: i for i, v in enumerate(v_visited)}
+        hh_hash = tuple((hh_index[hh], hh.multiplicity()) for hh in hh_history)
+        v_hash = tuple((v_index[v], v.filled) for v in v_history)
         return hash((hh_hash, v_hash))
 
     def is_isomorphic(self, other):
@@ -268,6 +276,10 @@ class HourglassPlabicGraph:
 
             This function is not intended to be used on non "properly formed" HPGs, and may fail or crash.
         """
+        # Rule out most non-isomorphic pairs before traversing
+        if self._get_isomorphism_invariants() != other._get_isomorphism_invariants():
+            return False
+
         self_hh_visited, self_hh_history, self_v_visited, self_v_history = self.traverse()
         other_hh_visited, other_hh_history, other_v_visited, other_v_history = other.traverse()
 
@@ -559,6 +571,34 @@ class HourglassPlabicGraph:
 
         return self.create_hourglass(v1, v2, multiplicity)
 
+    def create_hourglasses_by_ids(self, specs):
+        r"""
+        Creates hourglasses between the vertices identified by each pair of IDs in `specs`, in order,
+        and returns them.
+
+        INPUT:
+
+        - `specs` -- iterable of tuples `(v1_id, v2_id)` or `(v1_id, v2_id, multiplicity)`;
+                     the multiplicity defaults to 1 as in create_hourglass_by_id.
+
+        OUTPUT: list of HalfHourglass; for each tuple, the HalfHourglass from `v1_id` to `v2_id`.
+
+        EXAMPLES:
+
+            sage: HPG = HourglassPlabicGraph(6)
+            sage: HPG.create_vertex(6, 0, 0, True)
+            sage: hhs = HPG.create_hourglasses_by_ids([(6, 0), (6, 2, 2), (6, 4)])
+            sage: HPG._get_vertex(6).total_degree()
+            4
+        """
+        hhs = []
+        for spec in specs:
+            v1_id, v2_id, *rest = spec
+            if len(rest) > 1: raise ValueError(f"Expected a tuple (v1_id, v2_id) or (v1_id, v2_id, multiplicity), got {spec}.")
+            multiplicity = rest[0] if rest else 1
+            hhs.append(self.create_hourglass(self._get_vertex(v1_id), self._get_vertex(v2_id), multiplicity))
+        return hhs
+
     def create_hourglass(self, v1, v2, multiplicity=1, v1_base=None, v2_base=None):
         r"""
         Creates an hourglass (two HalfHourglasses) between v1 and v2, and returns it.
@@ -990,7 +1030,7 @@ class HourglassPlabicGraph:
             HPG = Examples.get_example("example_6_by_6")
             sphinx_plot(HPG)
         """
-        if v1_id == None and v2_id == None:
+        if v1_id is None and v2_id is None:
             hh = None
         else:
             hh = self._get_hourglass_by_id(v1_id, v2_id)
@@ -1048,7 +1088,7 @@ class HourglassPlabicGraph:
             HPG.cycle("face159", 72, 74)
             sphinx_plot(HPG)
         """
-        if v1_id == None and v2_id == None:
+        if v1_id is None and v2_id is None:
             hh = None
         else:
             hh = self._get_hourglass_by_id(v1_id, v2_id)
@@ -1595,8 +1635,7 @@ class HourglassPlabicGraph:
         sbv = self.sorted_boundary_vertices()
         sbv_idxs = {v:i for i,v in enumerate(sbv)}
         for vertex in sbv:
-            trip = vertex.get_trip(i)
-            final_vertex = trip[-1].v_to()
+            final_vertex = vertex.get_trip_end(i).v_to()
             perm.append(sbv_idxs[final_vertex]+1)
         return perm
 
@@ -1611,7 +1650,7 @@ class HourglassPlabicGraph:
             sage: HPG.get_trip_perms()
             [[1, 4, 3, 6, 5, 0, 7, 2], [3, 6, 5, 0, 7, 2, 1, 4], [5, 0, 7, 2, 1, 4, 3, 6]]
         """
-        r = max(v.total_degree() for v in self._inner_vertices.values()) # This is quite inefficient, could be a cached value provided by user?
+        r = max(v.total_degree() for v in self._inner_vertices.values())
         return [self.get_trip_perm(i) for i in range(1, r)]
 
     def get_proper_labelings(self, fix_initial=False):
@@ -1846,10 +1885,11 @@ class HourglassPlabicGraph:
             HPG.tutte_layout()
             sphinx_plot(HPG)
         """
+        # the graph does not change during the layout, so neighbours are looked up once rather than every iteration
+        adjacency = [(v, v.get_neighbors()) for v in self._inner_vertices.values()]
         for i in range(max_iter):
             err = 0
-            for v in self._inner_vertices.values():
-                neighbours = v.get_neighbors()
+            for v, neighbours in adjacency:
                 x_new = sum(w.x for w in neighbours)/len(neighbours)
                 y_new = sum(w.y for w in neighbours)/len(neighbours)
                 err += (v.x-x_new)**2 + (v.y-y_new)**2
@@ -1994,16 +2034,20 @@ class HourglassPlabicGraph:
                 "vertexIds": [str(v.id) for v in f.vertices()]
             } for f in self._faces.values() if not f.outer]
         }
+        edge_dicts = d["edges"]
         for h in edges:
-            for i,s in enumerate(h.iterate_strands()):
-                d["edges"].append({
+            # these are shared by every strand of the hourglass
+            multiplicity = int(h.multiplicity())
+            source_id = str(h.v_from().id)
+            target_id = str(h.v_to().id)
+            edge_dicts.extend({
                 "id" : s.id,
-                "index": int(i),
-                "multiplicity": int(h.multiplicity()),
-                "sourceId": str(h.v_from().id),
-                "targetId": str(h.v_to().id),
+                "index": i,
+                "multiplicity": multiplicity,
+                "sourceId": source_id,
+                "targetId": target_id,
                 "label": str(s.label),
-                })
+                } for i,s in enumerate(h.iterate_strands()))
  
         return d
 
@@ -2171,6 +2215,18 @@ looseness=1.5
 
     # Internal accessors
 
+    def _get_isomorphism_invariants(self):
+        r"""
+        Internal helper function that computes cheap invariants preserved by isomorphism:
+        the numbers of boundary and interior vertices, the number of filled interior vertices,
+        and the sorted total degrees of the interior vertices.
+
+        OUTPUT: tuple
+        """
+        inner = self._inner_vertices.values()
+        return (len(self._boundary_vertices), len(self._inner_vertices), sum(1 for v in inner if v.filled),
+            tuple(sorted(v.total_degree() for v in inner)))
+
     def _get_face(self, f_id):
         r"""
         Internal helper function that gets the face with the given ID.
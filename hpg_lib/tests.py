@@ -8,34 +8,57 @@ from .hourglassplabicgraph import HourglassPlabicGraph
 
 from .examples import Examples
 
+import io
 import math
+import random
 import json
-from sage.graphs.graph import Graph
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+_PI_OVER_4 = math.pi/4
 
 # Proxy classes for testing lower level classes
 
 class _TestHalfHourglass:
+    __slots__ = ()
+
     def twin(self):
         return self
 
 class _TestVertex:
+    __slots__ = ('x', 'y', 'id', '_total_degree')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.id = 'id'
+        self._total_degree = 0
 
-def all_tests():
+def all_tests(parallel=False):
     dihedral_element_tests()
-    half_strand_tests()
-    half_hourglass_tests()
-    vertex_tests()
-    face_tests()
-    hourglass_plabic_graph_tests()
+
+    independent_tests = [half_strand_tests, half_hourglass_tests, vertex_tests, face_tests, hourglass_plabic_graph_tests]
+    if parallel:
+        # Separate processes rather than threads: tests reset the shared ID counter, and each process gets its own.
+        with ProcessPoolExecutor(max_workers=len(independent_tests)) as executor:
+            for output in executor.map(_run_captured, independent_tests):
+                print(output, end='')
+    else:
+        for test in independent_tests:
+            test()
+
     move_tests()
     serialization_tests()
-    reduced_tests()
+    reduced_tests(parallel)
     separation_labeling_tests()
 
+def _run_captured(test):
+    # Buffers a test's output so that tests run in parallel print in order.
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        test()
+    return buffer.getvalue()
+
 # TESTS FOR BASE CLASS FUNCTIONALITY
 
 def dihedral_element_tests():
@@ -52,6 +75,7 @@ def dihedral_element_tests():
     # list order should now be d1, d3, d2
     assert d1.get_num_elements() == 3, f"All 3 elements should be in list. Instead contains only {d1.get_num_elements()}."
     assert d1.get_elements_as_list() == [d1, d3, d2], "Iteration does not form proper list."
+    assert d1.get_elements_as_list(False) == [d1, d2, d3], "Counterclockwise iteration does not form proper list."
     assert (
         d1.cw_next() == d3  and
         d1.ccw_next() == d2 and
@@ -67,6 +91,7 @@ def dihedral_element_tests():
 
     assert d1.get_cw_ith_element(4) == d3, "get_cw_ith_element is broken."
     assert d1.get_ccw_ith_element(7) == d2, "get_ccw_ith_element is broken."
+    assert d1.get_cw_ith_element(3001) == d3 and d1.get_ccw_ith_element(3002) == d3, "Full loops are not skipped correctly."
 
     d3.remove()
     assert d1.get_num_elements() == 2, "d3 should have been removed correctly."
@@ -82,7 +107,7 @@ def half_strand_tests():
     hh2 = _TestHalfHourglass()
 
     s1 = HalfStrand(1, hh1)
-    assert s1.twin() != None, "s1 should have created a twin."
+    assert s1.twin() is not None, "s1 should have created a twin."
     assert s1.twin().twin() == s1, "s1's twin's twin should be s1."
 
     assert s1.get_last_strand_same_hourglass() == s1, "s1 is not linked to itself properly when alone."
@@ -109,20 +134,39 @@ def half_hourglass_tests():
     v1 = _TestVertex(0, 0)
     v2 = _TestVertex(1, 1)
     hh = HalfHourglass(1, v1, v2, 1)
-    assert hh.twin() != None, "hh should have created a twin."
+    assert hh.twin() is not None, "hh should have created a twin."
     assert hh.twin().twin() == hh, "hh's twin's twin should be hh."
     assert hh.v_to() == hh.twin().v_from() and hh.v_from() == hh.twin().v_to(), "hh and twin should have swapped vertices."
-    assert hh.get_angle() == math.pi/4, f"hh angle should be pi/4 (45 degrees). instead, it is {hh.get_angle()}."
+    assert math.isclose(hh.get_angle(), _PI_OVER_4, rel_tol=1e-12), f"hh angle should be pi/4 (45 degrees). instead, it is {hh.get_angle()}."
 
     hh.thicken()
     hh.thicken()
     hh.thicken()
     assert hh.strand_count() == 4, f"hh should have 4 strands. Instead, it has {hh.strand_count()}."
-    assert len([s for s in hh.iterate_strands()]) == 4, f"Strand iteration on hh should count 4 strands, but instead counts {len([s for s in hh.iterate_strands()])} strands."
+    assert _count(hh.iterate_strands()) == 4, f"Strand iteration on hh should count 4 strands, but instead counts {_count(hh.iterate_strands())} strands."
     hh.thin()
     hh.thin()
     assert hh.strand_count() == 2, f"hh should have 2 strands. Instead, it has {hh.strand_count()}."
 
+    # Random thicken/thin sequence; thinning a single strand must fail and leave the edge intact.
+    rng = random.Random(0)
+    hh2 = HalfHourglass(5, v1, v2, 1)
+    expected = 1
+    for _ in range(1000):
+        if rng.random() < 0.5:
+            hh2.thicken()
+            expected += 1
+        elif expected == 1:
+            try:
+                hh2.thin()
+                assert False, "Thinning an edge with one strand should raise a RuntimeError."
+            except RuntimeError: pass
+        else:
+            hh2.thin()
+            expected -= 1
+        assert hh2.strand_count() == expected and hh2.twin().strand_count() == expected, f"hh2 should have {expected} strands. Instead, it has {hh2.strand_count()}."
+    assert hh2._half_strands_head.get_num_elements() == expected, "Strands were not linked properly during thicken/thin sequence."
+
     hhp = HalfHourglass(2, v1, v2, 0)
     assert hhp.is_phantom() and hhp.strand_count() == 0, "hhp should be a phantom (boundary) edge."
 
@@ -140,10 +184,10 @@ def half_hourglass_tests():
     assert hh4.strand_count() == 2, f"Strands were not linked properly between hourglasses during insertions. hh4 should have 2 strands. Instead has {hh4.strand_count()}."
     assert hh._half_strands_head.get_num_elements() == 2 + 5 + 2, "Strands were not linked properly all the way around during insertions."
 
-    assert len([s for s in hh.iterate_strands()]) == 2, f"Strand iteration on hh should count 2 strands, but instead counts {len([s for s in hh.iterate_strands()])} strands."
-    assert len([s for s in hhp.iterate_strands()]) == 0, f"Strand iteration on hhp should count 0 strands, but instead counts {len([s for s in hhp.iterate_strands()])} strands."
-    assert len([s for s in hh3.iterate_strands()]) == 5, f"Strand iteration on hh3 should count 5 strands, but instead counts  {len([s for s in hh3.iterate_strands()])} strands."
-    assert len([s for s in hh4.iterate_strands()]) == 2, f"Strand iteration on hh4 should count 2 strands, but instead counts  {len([s for s in hh4.iterate_strands()])} strands."
+    assert _count(hh.iterate_strands()) == 2, f"Strand iteration on hh should count 2 strands, but instead counts {_count(hh.iterate_strands())} strands."
+    assert _count(hhp.iterate_strands()) == 0, f"Strand iteration on hhp should count 0 strands, but instead counts {_count(hhp.iterate_strands())} strands."
+    assert _count(hh3.iterate_strands()) == 5, f"Strand iteration on hh3 should count 5 strands, but instead counts  {_count(hh3.iterate_strands())} strands."
+    assert _count(hh4.iterate_strands()) == 2, f"Strand iteration on hh4 should count 2 strands, but instead counts  {_count(hh4.iterate_strands())} strands."
 
     hhp.remove()
     hh3.remove()
@@ -151,6 +195,20 @@ def half_hourglass_tests():
     assert hh.strand_count() == 2 and hh4.strand_count() == 2, "Strands were not linked properly between hourglasses during removals."
     assert hh._half_strands_head.get_num_elements() == 2 + 2, "Strands were not linked properly all the way around during removals."
 
+    # splice_in_order should build the same lists as a sequence of insert_cw_next calls
+    multiplicities = [2, 0, 5, 1, 0]
+    sequential = [HalfHourglass(10 + i, v1, v2, m) for i, m in enumerate(multiplicities)]
+    for prev, next_hh in zip(sequential, sequential[1:]):
+        prev.insert_cw_next(next_hh)
+    spliced = [HalfHourglass(20 + i, v1, v2, m) for i, m in enumerate(multiplicities)]
+    spliced[0].splice_in_order(spliced[1:])
+
+    assert spliced[0].get_elements_as_list() == spliced, "splice_in_order did not insert hourglasses in the given order."
+    assert all(spliced_hh.strand_count() == m for spliced_hh, m in zip(spliced, multiplicities)), "Strands were not linked properly between hourglasses during splice_in_order."
+    sequential_order = [sequential.index(s.hourglass()) for s in sequential[0]._half_strands_head]
+    spliced_order = [spliced.index(s.hourglass()) for s in spliced[0]._half_strands_head]
+    assert spliced_order == sequential_order, f"splice_in_order linked strands in order {spliced_order}, but sequential insertion gives {sequential_order}."
+
     #TODO: test is_left_face_valid
 
     print("HalfHourglass tests complete.\n")
@@ -158,17 +216,22 @@ def half_hourglass_tests():
 def vertex_tests():
     print("Testing Vertex class.")
 
-    v1 = Vertex(1, 0, 0, True)
-    v2 = Vertex(2, 1, 0, False)
-    v3 = Vertex(3, 1, 1, True)
-    v4 = Vertex(4, 0, 1, False)
+    v1, v2, v3, v4 = create_test_square()
 
-    Vertex.create_hourglass_between(v1, v2, 1)
-    Vertex.create_hourglass_between(v1, v3, 2)
-    Vertex.create_hourglass_between(v1, v4, 5)
-    Vertex.create_hourglass_between(v2, v4, 0)
+    Vertex.create_hourglasses_batch([(v1, v2), (v1, v3, 2), (v1, v4, 5), (v2, v4, 0)])
+
+    # the batch should link hourglasses and strands exactly as sequential creation does
+    w1, w2, w3, w4 = create_test_square()
+    Vertex.create_hourglass_between(w1, w2, 1)
+    Vertex.create_hourglass_between(w1, w3, 2)
+    Vertex.create_hourglass_between(w1, w4, 5)
+    Vertex.create_hourglass_between(w2, w4, 0)
+    for v, w in zip((v1, v2, v3, v4), (w1, w2, w3, w4)):
+        assert [hh.v_to().id for hh in v] == [hh.v_to().id for hh in w], f"Batch creation ordered hourglasses around vertex {v.id} differently from create_hourglass_between."
+        assert v._half_hourglasses_head.v_to().id == w._half_hourglasses_head.v_to().id, f"Batch creation chose a different head hourglass for vertex {v.id}."
+        assert _strand_order(v) == _strand_order(w), f"Batch creation linked strands around vertex {v.id} differently from create_hourglass_between."
 
-    assert v1.simple_degree() == 3, f"v1 should have 3 hourglasses around it. Instead has{v1.simple_degree()}."
+    assert v1.simple_degree() == 3, f"v1 should have 3 hourglasses around it. Instead has {v1.simple_degree()}."
     assert v1.total_degree() == 8, f"v1 should have 8 strands around it. Instead has {v1.total_degree()}."
     assert v4.simple_degree() == 2, f"v4 should have 2 hourglasses implicitly created around it. Instead has {v4.simple_degree()}."
     assert v4.total_degree() == 5, f"v4 should have 5 strands around it. Instead has {v4.total_degree()}."
@@ -203,9 +266,11 @@ def vertex_tests():
     hh2 = Vertex.create_hourglass_between(v5, extras[1], 1)
     hh3 = Vertex.create_hourglass_between(v6, extras[2], 1)
     hh4 = Vertex.create_hourglass_between(v6, extras[3], 1)
+    # neighbors of the merged vertex after a contraction, in cyclic order
+    contracted_neighbors = [extras[2], extras[0], extras[1], extras[3]]
 
     v5.square_move_contract(mid_hh)
-    assert cyclically_equal(v6.get_neighbors(), [extras[2], extras[0], extras[1], extras[3]]), "v6 should be connected to 7, 8, 9, and 10."
+    assert cyclically_equal(v6.get_neighbors(), contracted_neighbors), "v6 should be connected to 7, 8, 9, and 10."
     v5 = v6.square_move_expand(hh2, hh1)
     assert (
         cyclically_equal(v5.get_neighbors(), [v6, extras[0], extras[1]]) and
@@ -213,13 +278,25 @@ def vertex_tests():
     ), "Graph should have returned to previous state."
 
     v6.square_move_contract(list(v5)[1].twin())
-    assert cyclically_equal(v5.get_neighbors(), [extras[2], extras[0], extras[1], extras[3]]), "v5 should be connected to 7, 8, 9, and 10."
+    assert cyclically_equal(v5.get_neighbors(), contracted_neighbors), "v5 should be connected to 7, 8, 9, and 10."
     v6 = v5.square_move_expand(hh3, hh4)
     assert (
         cyclically_equal(v5.get_neighbors(), [v6, extras[0], extras[1]]) and
         cyclically_equal(v6.get_neighbors(), [extras[2], v5, extras[3]])
     ), "Graph should have returned to previous state."
 
+    # Vertices may move after their hourglasses are inserted (e.g. by tutte_layout or make_circular).
+    # Insertion then walks from the nearest local minimum of angle rather than searching the whole ring.
+    center = Vertex(11, 0, 0, True)
+    ring = [Vertex(12, 1, 0, False), Vertex(13, 0, 1, False), Vertex(14, -1, 0, False), Vertex(15, 0, -1, False)]
+    for v in ring: Vertex.create_hourglass_between(center, v, 1)
+    ring[1].x, ring[1].y = 1, -1 # moved from pi/2 to 7pi/4; the stored order is unchanged
+    Vertex.create_hourglass_between(center, Vertex(16, 1, 1, False), 1)
+    expected_ids = [12, 16, 13, 14, 15]
+    assert [hh.v_to().id for hh in center] == expected_ids, f"Hourglass inserted after a vertex move should give ring order {expected_ids}. Instead has {[hh.v_to().id for hh in center]}."
+    assert center._half_hourglasses_head.v_to() == ring[0], "The head should remain the hourglass to vertex 12."
+    assert _strand_order(center) == expected_ids[:1] + expected_ids[:0:-1], "Strands were not linked properly when inserting after a vertex move."
+
     print("Vertex tests complete.\n")
 
 def face_tests():
@@ -227,10 +304,7 @@ def face_tests():
     # Square move tests
     ID.reset_id()
 
-    v1 = Vertex(1, 0, 0, True)
-    v2 = Vertex(2, 1, 0, False)
-    v3 = Vertex(3, 1, 1, True)
-    v4 = Vertex(4, 0, 1, False)
+    v1, v2, v3, v4 = create_test_square()
     extras = [Vertex(5, -1, -1, False), Vertex(6, 2, -1, True), Vertex(7, 2, 1, False), Vertex(8, 1, 2, False), Vertex(9, 0, 2, True), Vertex(10, -1, 1, True), Vertex(11, -2, -1, True), Vertex(12, -1, -2, True), Vertex(13, 2, -2, False), Vertex(14, 3, -1, False)]
     hh1 = Vertex.create_hourglass_between(v1, v2, 1)
     Vertex.create_hourglass_between(v2, v3, 1)
@@ -253,8 +327,9 @@ def face_tests():
     assert face.is_square_move_valid(), "Square move should be valid on face."
     rem_add_tuple = face.square_move()
     assert face.is_square_move_valid(), "Square move should be valid on face even after performing square move."
-    assert [v.id for v in rem_add_tuple[0]] == ['v16', 'v19'], f"Incorrect vertices marked for addition. Marked vertices are {[v.id for v in rem_add_tuple[0]]}, but should hould be ['v16', 'v19']."
-    assert rem_add_tuple[1] == [v2, v1], f"Incorrect vertices marked for removal. Marked vertices are {[v.id for v in rem_add_tuple[0]]} but should be [v2, v1]."
+    added_ids = [v.id for v in rem_add_tuple[0]]
+    assert added_ids == ['v16', 'v19'], f"Incorrect vertices marked for addition. Marked vertices are {added_ids}, but should be ['v16', 'v19']."
+    assert rem_add_tuple[1] == [v2, v1], f"Incorrect vertices marked for removal. Marked vertices are {[v.id for v in rem_add_tuple[1]]} but should be [v2, v1]."
     rem_add_tuple = face.square_move()
     assert face.is_square_move_valid(), "Square move should be valid on face even after performing square move twice."
 
@@ -354,7 +429,7 @@ def hourglass_plabic_graph_tests():
 
     ID.reset_id()
     HPG = HourglassPlabicGraph()
-    HPG.construct_face(6, [1+(i%2) for i in range(0, 6)])
+    HPG.construct_face(6, [1, 2, 1, 2, 1, 2])
     assert len(HPG._boundary_vertices) == 6, f"HPG should have been initialized with 6 boundary vertices. Instead, has {len(HPG._boundary_vertices)}."
     assert len(HPG._inner_vertices) == 6, f"HPG should have been initialized with 6 inner vertices. Instead, has {len(HPG._inner_vertices)}."
     assert len(HPG._faces) == 8, f"HPG should have eight faces. Instead, has {len(HPG._faces)}."
@@ -367,7 +442,7 @@ def hourglass_plabic_graph_tests():
     '''
     print("Checking for proper face initialization.")
     for v in list(HPG._boundary_vertices.values()) + list(HPG._inner_vertices.values()):
-        print(str(v.id) + ": " + str([hh.left_face().id for hh in v]))
+        print(f"{v.id}: {[hh.left_face().id for hh in v]}")
         #v.print_neighbors()
     HPG.print_faces()
     '''
@@ -415,6 +490,16 @@ def hourglass_plabic_graph_tests():
     assert HPG1.is_isomorphic(HPG2), "HPG1 should be isomorphic to HPG2."
     assert HPG3.is_isomorphic(HPG4), "HPG3 should be isomorphic to HPG4."
     assert not HPG1.is_isomorphic(HPG3), "HPG1 should not be isomorphic to HPG3."
+    assert HPG1._get_isomorphism_invariants() == HPG2._get_isomorphism_invariants(), "Isomorphic graphs HPG1 and HPG2 should have equal isomorphism invariants."
+
+    # These differ only in edge multiplicities, so the invariants agree and the full traversal must tell them apart
+    HPG5 = HourglassPlabicGraph()
+    HPG5.construct_face(6, [2, 1, 2, 1, 2, 1])
+    HPG6 = HourglassPlabicGraph()
+    HPG6.construct_face(6, [1, 2, 1, 2, 1, 2])
+    assert HPG5._get_isomorphism_invariants() == HPG6._get_isomorphism_invariants(), "HPG5 and HPG6 should have equal isomorphism invariants."
+    assert not HPG5.is_isomorphic(HPG6), "HPG5 should not be isomorphic to HPG6, as their edge multiplicities differ."
+
     HPG.square_move("face12")
     assert HPG1.is_isomorphic(HPG), "HPG1 should be isomorphic to HPG, even after two square moves."
 
@@ -422,14 +507,17 @@ def hourglass_plabic_graph_tests():
 
 # TESTS FOR EXTENDED HOURGLASS PLABIC GRAPH FUNCTIONALITY
 
-def move_tests():
+def move_tests(plot=False):
     print("Testing moves.")
     ID.reset_id()
     plots = []
+    def record_plot(title):
+        # Plotting is slow, so plots are only generated when requested
+        if plot: plots.append((title, HPG.plot()))
 
     HPG = Examples.get_example("example_ASM")
     face_id = "face2"
-    plots.append(("HPG before square move:", HPG.plot()))
+    record_plot("HPG before square move:")
     assert HPG.is_square_move_valid(face_id), f"Square move should be valid on {face_id}."
 
     '''
@@ -441,11 +529,11 @@ def move_tests():
 
     # Square move test
     HPG.square_move(face_id)
-    plots.append(("HPG after first square move:", HPG.plot()))
+    record_plot("HPG after first square move:")
     assert HPG.is_square_move_valid(face_id), f"Square move should be valid on {face_id} after performing square move."
 
     HPG.square_move(face_id)
-    plots.append(("HPG after second square move:", HPG.plot()))
+    record_plot("HPG after second square move:")
     assert HPG.is_square_move_valid(face_id), f"Square move should be valid on {face_id} after performing second square move."
 
 
@@ -455,10 +543,10 @@ def move_tests():
 #    assert not HPG.is_benzene_move_valid(face_id), f"Benzene move should not be valid on {face_id}."
 #    HPG.thicken_hourglass_by_id(9, "v36")
 #    HPG.thicken_hourglass_by_id(11, "v33")
-#    plots.append(("HPG after thickening:", HPG.plot()))
+#    record_plot("HPG after thickening:")
 #    assert HPG.is_benzene_move_valid(face_id), f"Benzene move should be valid on {face_id} after thickening some edges."
 #    HPG.benzene_move(face_id)
-#    plots.append(("HPG after benzene move:", HPG.plot()))
+#    record_plot("HPG after benzene move:")
 #    assert HPG._get_hourglass_by_id(9, "v33").multiplicity() == 2, f"Hourglass between 9 and v33 should have multiplicity 2. Instead has multiplicity {HPG._get_hourglass_by_id('9', 'v33').multiplicity()}."
 #    assert HPG._get_hourglass_by_id("v33", 11).multiplicity() == 1, f"Hourglass between v33 and 11 should have multiplicity 1. Instead has multiplicity {HPG._get_hourglass_by_id('v33', '11').multiplicity()}."
 #    assert HPG._get_hourglass_by_id(11, "v36").multiplicity() == 2, f"Hourglass between 11 and v36 should have multiplicity 2. Instead has multiplicity {HPG._get_hourglass_by_id('11', 'v36').multiplicity()}."
@@ -477,15 +565,15 @@ def move_tests():
     ID.reset_id()
     HPG = Examples.get_example("example_2_column_running")
     face_id = "face9"
-    plots.append(("HPG before square move in SL7:", HPG.plot()))
+    record_plot("HPG before square move in SL7:")
     assert HPG.is_square_move_valid(face_id, 7), f"Square move should be valid on {face_id}."
 
     HPG.square_move(face_id, 7)
-    plots.append(("HPG after first square move in SL7:", HPG.plot()))
+    record_plot("HPG after first square move in SL7:")
     assert HPG.is_square_move_valid(face_id, 7), f"Square move should be valid on {face_id} after performing square move."
 
     HPG.square_move(face_id, 7)
-    plots.append(("HPG after second square move in SL7:", HPG.plot()))
+    record_plot("HPG after second square move in SL7:")
     assert HPG.is_square_move_valid(face_id, 7), f"Square move should be valid on {face_id} after performing second square move."
 
     print("Move tests complete.\n")
@@ -501,7 +589,7 @@ def serialization_tests():
     #HPG2.print_faces()
     print("Serialization tests complete.\n")
 
-def reduced_tests():
+def reduced_tests(parallel=False):
     print("Testing is_fully_reduced.")
 
     verbose = False
@@ -512,24 +600,34 @@ def reduced_tests():
             if verbose: print(f"{name} is{' ' if expected else ' not '}fully reduced.")
         else: print(f"{name} is{' ' if Examples.get_example(name).is_fully_reduced(r, verbose) else ' not '}fully reduced (unkown expectation).")
 
-    # Reduced HPGs
-    test_reducedness("example_ASM", 4, True)
-    test_reducedness("example_5_by_2", 5, True)
-#    test_reducedness("example_5_by_3_ASM", 5, True)
-    test_reducedness("example_9_by_2", 9, True)
-    test_reducedness("example_2_column_running", 7, True)
-    test_reducedness("example_2_column_running_after_squaremove", 7, True)
-    test_reducedness("example_2_column_running_ear_cut", 7, True)
-    test_reducedness("example_benzene", 4, True)
-    test_reducedness("example_double_crossing", 4, True)
-#    test_reducedness("example_6_by_3", 6, True)
-
-    # Non-reduced HPGs
-    test_reducedness("example_benzene_full_nonreduced", 4, False)
-#    test_reducedness("example_5x4_badsep", 5, False)
-#    test_reducedness("example_6_by_3_bad", 6, False)
-    test_reducedness("example_fat_square", 4, False)
-    test_reducedness("example_some_plabic", 3, False)
+    cases = [
+        # Reduced HPGs
+        ("example_ASM", 4, True),
+        ("example_5_by_2", 5, True),
+#        ("example_5_by_3_ASM", 5, True),
+        ("example_9_by_2", 9, True),
+        ("example_2_column_running", 7, True),
+        ("example_2_column_running_after_squaremove", 7, True),
+        ("example_2_column_running_ear_cut", 7, True),
+        ("example_benzene", 4, True),
+        ("example_double_crossing", 4, True),
+#        ("example_6_by_3", 6, True),
+
+        # Non-reduced HPGs
+        ("example_benzene_full_nonreduced", 4, False),
+#        ("example_5x4_badsep", 5, False),
+#        ("example_6_by_3_bad", 6, False),
+        ("example_fat_square", 4, False),
+        ("example_some_plabic", 3, False),
+    ]
+    if parallel and not verbose:
+        # The examples are independent, so they can be checked in separate processes
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_is_example_fully_reduced, cases)
+            for (name, r, expected), reduced in zip(cases, results):
+                assert reduced == expected, f"{name} should{' ' if expected else ' not '}be fully reduced."
+    else:
+        for case in cases: test_reducedness(*case)
 
     if verbose:
         # Test unknown examples
@@ -546,6 +644,11 @@ def reduced_tests():
 
     print("is_fully_reduced tests complete.\n")
 
+def _is_example_fully_reduced(case):
+    # Worker for reduced_tests; case is a tuple (name, r, expected)
+    name, r, _ = case
+    return Examples.get_example(name).is_fully_reduced(r)
+
 def separation_labeling_tests():
     print("Testing separation_labeling.")
 
@@ -601,6 +704,10 @@ def separation_labeling_tests():
 
     print("separation_labeling tests complete.\n")
 
+def create_test_square():
+    '''Creates four unconnected vertices at the corners of the unit square, alternating filled and unfilled.'''
+    return Vertex(1, 0, 0, True), Vertex(2, 1, 0, False), Vertex(3, 1, 1, True), Vertex(4, 0, 1, False)
+
 def create_test_HPG():
     '''
     Creates the following graph with the labeled IDs:
@@ -630,24 +737,44 @@ def create_test_HPG():
     HPG.create_vertex(11, -5,  5, False)
     HPG.create_vertex(12, 2,  2, True)
     HPG.create_vertex(13, -2,  -2, True)
-    HPG.create_hourglass_by_id(8, 12, 2)
-    HPG.create_hourglass_by_id(10, 13, 2)
-    HPG.create_hourglass_by_id(9, 12)
-    HPG.create_hourglass_by_id(9, 13)
-    HPG.create_hourglass_by_id(11, 12)
-    HPG.create_hourglass_by_id(11, 13)
-    HPG.create_hourglass_by_id(8, 0)
-    HPG.create_hourglass_by_id(8, 1)
-    HPG.create_hourglass_by_id(9, 2)
-    HPG.create_hourglass_by_id(9, 3)
-    HPG.create_hourglass_by_id(10, 4)
-    HPG.create_hourglass_by_id(10, 5)
-    HPG.create_hourglass_by_id(11, 6)
-    HPG.create_hourglass_by_id(11, 7)
+    HPG.create_hourglasses_by_ids([
+        (8, 12, 2), (10, 13, 2),
+        (9, 12), (9, 13), (11, 12), (11, 13),
+        (8, 0), (8, 1), (9, 2), (9, 3), (10, 4), (10, 5), (11, 6), (11, 7)
+    ])
     return HPG
 
+def _strand_order(v):
+    '''Lists the vertex IDs reached by each strand around v, clockwise from the strand of its head hourglass.'''
+    first = v._half_hourglasses_head._get_first_strand()
+    if first is None: return []
+    return [strand.hourglass().v_to().id for strand in first.iterate_clockwise()]
+
+def _count(iterable):
+    '''Counts the elements of an iterable without building a list.'''
+    n = 0
+    for _ in iterable: n += 1
+    return n
+
 def cyclically_equal(L1, L2):
     '''Determines if some cyclic rotation of L1 is equal to L2. Assumes they are list-like.'''
     if len(L1) != len(L2):
         return False
     return any(L1[i:]+L1[:i]==L2 for i in range(len(L1)))
+
+if __name__ == "__main__":
+    import sys
+    if "--profile" in sys.argv:
+        # Profiles the HalfHourglass and Vertex tests; their output is discarded so printing doesn't dominate.
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        with redirect_stdout(io.StringIO()):
+            profiler.enable()
+            for _ in range(100):
+                half_hourglass_tests()
+                vertex_tests()
+            profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+    else:
+        all_tests()
@@ -29,6 +29,8 @@ class Vertex:
     When traversing an HPG, trip i turns at the ith left on an unfilled vertex
     and the ith right on a filled vertex.
     """
+    __slots__ = ('id', 'x', 'y', 'filled', 'boundary', 'label', '_half_hourglasses_head', '_simple_degree', '_total_degree')
+
     def __init__(self, id, x, y, filled, boundary=False, label=''):
         r"""
         Constructs a Vertex with the given ID, x and y positions, and filled and boundary statuses.
@@ -62,6 +64,11 @@ class Vertex:
         """
         self._half_hourglasses_head = None
 
+        # number of hourglasses around this vertex, maintained on hourglass insertion/removal
+        self._simple_degree = 0
+        # number of strands around this vertex, maintained on hourglass insertion/removal and thicken/thin
+        self._total_degree = 0
+
     def __repr__(self):
         r"""
         Returns a String representation of this Vertex, providing its ID, position, and filled status.
@@ -76,13 +83,6 @@ class Vertex:
         """
         return f"Vertex {self.id} at ({self.x}, {self.y}), {'filled' if self.filled else 'unfilled'}"
 
-    def _reset_head(self):
-        r"""
-        Resets _half_hourglasses_head to the hourglass with the smallest angle.
-        """
-        while self._half_hourglasses_head.get_angle() > self._half_hourglasses_head.cw_next().get_angle():
-            self._half_hourglasses_head = self._half_hourglasses_head.cw_next()
-
     # Hourglass construction and manipulation functions
 
     @classmethod
@@ -130,6 +130,61 @@ class Vertex:
         v2._insert_hourglass(hh.twin(), v2_base)
         return hh
 
+    @classmethod
+    def create_hourglasses_batch(cls, specs):
+        r"""
+        Creates several hourglasses at once, as if by repeated calls to create_hourglass_between.
+
+        INPUT:
+
+        - `specs` -- iterable of tuples `(v1, v2)` or `(v1, v2, multiplicity)` of Vertex;
+                     the multiplicity defaults to 1 as in create_hourglass_between.
+
+        OUTPUT: list of HalfHourglass; for each tuple, the HalfHourglass from `v1` to `v2`.
+
+        EXAMPLES:
+
+            sage: v1 = Vertex(1, 0, 0, True)
+            sage: v2 = Vertex(2, 1, 0, True)
+            sage: v3 = Vertex(3, 0, 1, True)
+            sage: hhs = Vertex.create_hourglasses_batch([(v1, v2), (v1, v3, 3)])
+            sage: v1.total_degree()
+            4
+
+        .. NOTE::
+
+            This function is a class method.
+
+            Specs take the same form as in HourglassPlabicGraph's create_hourglasses_by_ids, with
+            Vertex objects in place of IDs.
+
+            Vertices with no hourglasses beforehand have their new hourglasses sorted by angle once and
+            linked in a single pass, taking O(d log d) rather than the O(d^2) of repeated insertions.
+        """
+        hhs = []
+        for spec in specs:
+            v1, v2, *rest = spec
+            if len(rest) > 1: raise ValueError(f"Expected a tuple (v1, v2) or (v1, v2, multiplicity), got {spec}.")
+            hhs.append(HalfHourglass(None, v1, v2, rest[0] if rest else 1))
+
+        # group the new half hourglasses by the vertex they start from
+        outgoing = {}
+        for hh in hhs:
+            outgoing.setdefault(hh.v_from(), []).append(hh)
+            outgoing.setdefault(hh.v_to(), []).append(hh.twin())
+
+        for v, v_hhs in outgoing.items():
+            if v._half_hourglasses_head is None:
+                v_hhs.sort(key=HalfHourglass.get_angle)
+                v._half_hourglasses_head = v_hhs[0]
+                # counterclockwise order is increasing angle, so splice the rest in clockwise from the head in reverse
+                v_hhs[0].splice_in_order(v_hhs[:0:-1])
+                v._simple_degree += len(v_hhs)
+                v._total_degree += sum(hh._multiplicity for hh in v_hhs)
+            else:
+                for hh in v_hhs: v._insert_hourglass(hh)
+        return hhs
+
     def _insert_hourglass(self, hh, base=None):
         r"""
         Inserts a half hourglass into the hourglass list for this vertex, maintaining
@@ -150,23 +205,47 @@ class Vertex:
             This function should be called only on hourglasses originating from this vertex but not already
             tracked by this vertex. It is an internal function called in createdhourglass_between and reparent.
         """
+        self._simple_degree += 1
+        self._total_degree += hh._multiplicity
+
         # empty list case
         if self._half_hourglasses_head is None:
             self._half_hourglasses_head = hh
             return
 
         if base is None:
-            self._reset_head()
-            
-            # find first edge with greater angle, then insert_cw_next
             hh_angle = hh.get_angle()
-            for iter_hh in self:
+
+            # with a single edge, either side of it is the same position; only the head needs deciding
+            head = self._half_hourglasses_head
+            if head._ccw_next is head:
+                head.append_ccw(hh)
+                if hh_angle < head.get_angle(): self._half_hourglasses_head = hh
+                return
+
+            # Rotate the head clockwise while the angle decreases. Vertices can move after their hourglasses
+            # are inserted (e.g. tutte_layout, make_circular), so this stops at the nearest local minimum,
+            # which is the smallest angle whenever the ring is still sorted.
+            head_angle = head.get_angle()
+            prev_hh = head._cw_next
+            prev_angle = prev_hh.get_angle()
+            while head_angle > prev_angle:
+                head, head_angle = prev_hh, prev_angle
+                prev_hh = head._cw_next
+                prev_angle = prev_hh.get_angle()
+            self._half_hourglasses_head = head
+
+            # find first edge counterclockwise from the head with greater angle, then insert before it
+            iter_hh = head
+            while True:
                 if hh_angle < iter_hh.get_angle():
                     iter_hh.insert_ccw_prev(hh)
-                    if iter_hh is self._half_hourglasses_head: self._half_hourglasses_head = hh
+                    if iter_hh is head: self._half_hourglasses_head = hh
                     return
+                iter_hh = iter_hh._ccw_next
+                if iter_hh is head: break
             # we've run the entire loop, so angle is greater than every other edge
-            self._half_hourglasses_head.append_ccw(hh)
+            head.append_ccw(hh)
             return
         else:
             base.insert_ccw_prev(hh)
@@ -227,6 +306,8 @@ class Vertex:
             if hh is self._half_hourglasses_head: # this was the only remaining hourglass
                 self._half_hourglasses_head = None
         hh.remove()
+        self._simple_degree -= 1
+        self._total_degree -= hh._multiplicity
 
     def clear_hourglasses(self):
         r"""
@@ -245,8 +326,10 @@ class Vertex:
         if self._half_hourglasses_head is None: return
 
         for hh in self:
-            hh.v_to()._remove_hourglass(hh.twin())
+            hh._v_to._remove_hourglass(hh._twin)
         self._half_hourglasses_head = None # this may not be memory-safe, depending on python's garbage collection
+        self._simple_degree = 0
+        self._total_degree = 0
 
     def get_hourglass_to(self, v_to):
         r"""
@@ -270,8 +353,13 @@ class Vertex:
             sage: v1.get_hourglass_to(v2)
             ValueError: Hourglass to vertex (Vertex v2 at (1, 0), unfilled) does not exist.
         """
-        for hh in self:
-            if hh.v_to() is v_to: return hh
+        # walk the ring directly rather than through the iterator; this is on the path of every hourglass lookup and removal
+        head = hh = self._half_hourglasses_head
+        if head is not None:
+            while True:
+                if hh._v_to is v_to: return hh
+                hh = hh._ccw_next
+                if hh is head: break
         raise ValueError(f"Hourglass to vertex ({v_to}) does not exist.")
 
     def get_trip(self, i, output='half_strands'):
@@ -297,6 +385,29 @@ class Vertex:
 
             :meth:`HalfStrand.get_trip`
         """
+        return self._get_trip_start().get_trip(i, output)
+
+    def get_trip_end(self, i):
+        r"""
+        Follows trip i from this vertex and returns the last HalfStrand of the trip, without recording the trip itself.
+
+        INPUT:
+
+        - ``i`` -- positive integer; the trip number. Assumed to be an integer `\geq 1`.
+
+        OUTPUT: HalfStrand; its v_to() is the vertex where the trip ends.
+
+        .. SEEALSO::
+
+            :meth:`get_trip`
+            :meth:`HalfStrand.get_trip_end`
+        """
+        return self._get_trip_start().get_trip_end(i)
+
+    def _get_trip_start(self):
+        r"""
+        Returns the strand on which trips from this vertex begin.
+        """
         # TODO: Fluctuating case and interior vertex algorithm
         # assert self.boundary, f"Vertex {self.id} should be on the boundary." # Not necessarily! Revise this when integrating with analyzer
         if self.total_degree() != 1: raise NotImplementedError("Fluctuating case not yet implemented for HPG trips.")
@@ -304,8 +415,7 @@ class Vertex:
         # find the hourglass to the graph interior
         hh = self._half_hourglasses_head
         while hh.is_boundary(): hh = hh.cw_next()
-        strand = hh._half_strands_head
-        return strand.get_trip(i, output)
+        return hh._half_strands_head
 
     def get_hourglasses_as_list(self):
         r"""
@@ -351,12 +461,19 @@ class Vertex:
             sage: v1.get_neighbors()
             [Vertex v2 at (1, 0), unfilled, Vertex v3 at (0, 1), unfilled, Vertex v4 at (-1, 0), unfilled]
         """
-        return [hh.v_to() for hh in self]
+        head = hh = self._half_hourglasses_head
+        if head is None: return []
+        neighbors = []
+        while True:
+            neighbors.append(hh._v_to)
+            hh = hh._ccw_next
+            if hh is head: return neighbors
 
     def get_adjacent_faces(self):
         '''Returns a list of adjacent faces in clockwise order.
            Skips the outer face.'''
-        return list(reversed([hh.left_face() for hh in self if not hh.left_face().outer]))
+        faces = [hh._left_face for hh in self]
+        return [face for face in reversed(faces) if not face.outer]
 
     def total_degree(self):
         r"""
@@ -374,10 +491,12 @@ class Vertex:
             sage: Vertex.create_hourglass_between(v, Vertex('v4', -1, 0, True), 1)
             sage: v.total_degree()
             6
+
+        .. NOTE::
+
+            Runtime: O(1); the degree is maintained as hourglasses are inserted, removed, thickened, and thinned.
         """
-        count = 0
-        for hh in self: count += hh.strand_count()
-        return count
+        return self._total_degree
 
     def simple_degree(self):
         r"""
@@ -395,9 +514,12 @@ class Vertex:
             sage: Vertex.create_hourglass_between(v, Vertex('v4', -1, 0, True), 1)
             sage: v.simple_degree()
             3
+
+        .. NOTE::
+
+            Runtime: O(1); the degree is maintained as hourglasses are inserted and removed.
         """
-        if (self._half_hourglasses_head is None): return 0
-        return self._half_hourglasses_head.get_num_elements()
+        return self._simple_degree
 
     # Vertex manipulation functions (may be deprecated/unecessary, also untested)
 
@@ -433,7 +555,8 @@ class Vertex:
 
         # Store hourglasses in array for safe iteration
         base = hh1.twin().ccw_next()
-        hhs = [hh for hh in del_v if hh is not hh2.twin()]
+        hh2_twin = hh2.twin()
+        hhs = [hh for hh in del_v if hh is not hh2_twin]
         for hh in hhs:
             hh.reparent(sur_v, base)
             base = hh